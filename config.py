@@ -10,24 +10,42 @@ IS_WINDOWS = platform.system() == "Windows"
 DEFAULT_MAX_WORKERS = 10
 MAX_WORKERS_LIMIT = 100
 
+# Accounts submitted to the pool but not yet collected, per worker; bounds
+# the number of live futures however long the credential list is
+MAX_INFLIGHT_PER_WORKER = 5
+
 HTTP_TIMEOUT = 10.0
 HTTP_CONNECTION_POOL_SIZE = 15
 HTTP_MAX_KEEPALIVE_CONNECTIONS = 8
 HTTP_CONNECT_TIMEOUT = 3.0
 HTTP_READ_TIMEOUT = 7.0
+HTTP_KEEPALIVE_EXPIRY = 30.0
+HTTP2_ENABLED = True
 
-# Platform-specific thread delay (Windows needs longer delays)
-THREAD_STARTUP_DELAY = 0.05 if IS_WINDOWS else 0.02
+# Fetch the order history and address pages of an account at the same time.
+# Off until the site is confirmed not to need the order history visit first
+# (the address request is still sent with it as Referer)
+CONCURRENT_ACCOUNT_PAGES = False
 
 # Platform-specific GUI update settings
-GUI_UPDATE_BATCH_SIZE = 20 if IS_WINDOWS else 10
 GUI_UPDATE_INTERVAL = 0.2 if IS_WINDOWS else 0.1
+STATS_UPDATE_INTERVAL_MS = 200
+
+# Results are passed from the extractor to its callback in batches
+CALLBACK_BATCH_SIZE = 50
+CALLBACK_BATCH_INTERVAL = 0.1
 
 MAX_LOG_ENTRIES = 1000
-EXPORT_CHUNK_SIZE = 100
+# Bytes copied from the results file per step of an export
+EXPORT_CHUNK_SIZE = 1 << 16
 LARGE_DATASET_THRESHOLD = 1000
 MAX_TABLE_ROWS = 5000
 
+# Username, Password, Phone Number, Status
+RESULTS_COLUMN_WIDTHS = [240, 120, 140, 260]
+RESULTS_ROW_HEIGHT = 22
+STATUS_PIXMAP_CACHE_KB = 10240
+
 # Platform-specific log limits
 MAX_LOG_LINES = 200 if IS_WINDOWS else 400
 
@@ -35,9 +53,12 @@ BASE_URL = "https://www.conforama.es"
 
 USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"
 ACCEPT_LANGUAGE = "en-US,en;q=0.5"
-ACCEPT_ENCODING = "gzip, deflate, br"
+ACCEPT_ENCODING = "gzip"
 
 DEFAULT_CREDENTIALS_FILE = "read.txt"
+PHONES_FILE = "phones.txt"
+LINE_WRITER_BATCH_SIZE = 64
+LINE_WRITER_FLUSH_INTERVAL = 0.1
 
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 700
@@ -5,85 +5,132 @@ Handles login, session management, and phone number extraction
 
 import httpx
 import re
+import threading
 import config
 
-PHONE_PATTERNS = [
-    re.compile(r'(\+34\s?)?[6-9]\d{8}', re.IGNORECASE),
-    re.compile(r'(\+34\s?)?[8-9]\d{8}', re.IGNORECASE),
-    re.compile(r'tel[^>]*>([^<]+)', re.IGNORECASE),
-    re.compile(r'phone[^>]*>([^<]+)', re.IGNORECASE),
-    re.compile(r'telefono[^>]*>([^<]+)', re.IGNORECASE),
-    re.compile(r'móvil[^>]*>([^<]+)', re.IGNORECASE),
-    re.compile(r'\b\d{3}[-\s]?\d{3}[-\s]?\d{3}\b', re.IGNORECASE),
-    re.compile(r'value="([6-9]\d{8})"', re.IGNORECASE),
-    re.compile(r'>\s*([6-9]\d{8})\s*<', re.IGNORECASE),
-]
+# RE2 matches in guaranteed linear time; the stdlib engine is the fallback
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
 
-PHONE_CLEANUP_PATTERN = re.compile(r'[^\d+]')
-DIGITS_PATTERN = re.compile(r'\d{9}')
+# Only mobile numbers are ever returned, so the pattern is built once from the
+# contexts a number can appear in (most selective first) around a single
+# 6-anchored core. Group 1 is always the number, whichever context matched.
+# Patterns are bytes so the raw response body is scanned without decoding.
+PHONE_PREFIXES = [rb'value="', rb'>\s*', rb'\+34\s?', rb'\b']
+PHONE_SUFFIXES = [rb'"', rb'\s*<', rb'\b']
+PHONE_CORE = rb'(6\d{2}[-\s]?\d{3}[-\s]?\d{3})'
 
+PHONE_PATTERN = _regex_engine.compile(
+    b'(?:' + b'|'.join(PHONE_PREFIXES) + b')' + PHONE_CORE +
+    b'(?:' + b'|'.join(PHONE_SUFFIXES) + b')'
+)
 
-class ConforamaSession:
-    def __init__(self):
-        timeout = httpx.Timeout(
-            connect=config.HTTP_CONNECT_TIMEOUT,
-            read=config.HTTP_READ_TIMEOUT,
-            write=config.HTTP_TIMEOUT,
-            pool=config.HTTP_TIMEOUT
-        )
-        
-        limits = httpx.Limits(
-            max_connections=config.HTTP_CONNECTION_POOL_SIZE,
-            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS
-        )
-        
-        self.session = httpx.Client(
-            follow_redirects=True,
-            timeout=timeout,
-            limits=limits,
-            headers={
-                "User-Agent": config.USER_AGENT,
-                "Accept-Language": config.ACCEPT_LANGUAGE,
-                "Accept-Encoding": "gzip, deflate",
-                "Upgrade-Insecure-Requests": "1",
-                "Sec-Fetch-Site": "same-origin",
-                "Te": "trailers"
-            }
-        )
-        
-    def _get_decoded_content(self, response):
-        try:
-            return response.text
-        except Exception:
-            content_encoding = response.headers.get('content-encoding', '').lower()
-            
-            if content_encoding == 'br':
-                try:
-                    import brotli
-                    decompressed = brotli.decompress(response.content)
-                    return decompressed.decode('utf-8')
-                except ImportError:
-                    return response.content.decode('utf-8', errors='replace')
-                except Exception:
-                    return response.content.decode('utf-8', errors='replace')
-            else:
-                return response.content.decode('utf-8', errors='replace')
+# Characters the core allows between digit groups ('-' and \s)
+PHONE_SEPARATORS = b'- \t\n\r\f\v'
+
+# Bytes re-scanned from the previous chunk when streaming, enough to cover
+# the longest match ('+34 ' followed by a separated number and a boundary)
+PHONE_MATCH_OVERLAP = 32
+
+
+# Returned by the request helpers on HTTP 401; callers compare by identity
+BANNED = "banned"
+
+ORDER_HISTORY_PATH = "/sales/order/history"
+
+# Only headers that differ from the client defaults are sent per request;
+# they are built once at import instead of on every call
+LOGIN_FORM_HEADERS = httpx.Headers({
+    "Origin": "https://www.conforama.es",
+    "Referer": "https://www.conforama.es/customer/account/login?returnUrl=%2Fsales%2Forder%2Fhistory"
+})
+
+ADDRESS_HEADERS = httpx.Headers({
+    "Referer": "https://www.conforama.es/sales/order/history"
+})
+
+# One client (and connection pool) per thread: keep-alive connections carry
+# over between accounts, while cookies never leak across concurrent workers
+_thread_local = threading.local()
+
+# Shared by every client: the CA bundle is parsed once per process, and all
+# TLS connections come from a single context
+_ssl_context = None
+
+
+def _get_ssl_context():
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = httpx.create_ssl_context()
+    return _ssl_context
+
+
+def _create_client():
+    timeout = httpx.Timeout(
+        connect=config.HTTP_CONNECT_TIMEOUT,
+        read=config.HTTP_READ_TIMEOUT,
+        write=config.HTTP_TIMEOUT,
+        pool=config.HTTP_TIMEOUT
+    )
     
-    def get_login_page(self):
-        login_page_url = "https://www.conforama.es/customer/account/login?returnUrl=%2Fsales%2Forder%2Fhistory"
-        
-        headers = {
+    limits = httpx.Limits(
+        max_connections=config.HTTP_CONNECTION_POOL_SIZE,
+        max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY
+    )
+    
+    # All requests go to the same origin, so HTTP/2 lets them share a
+    # single multiplexed connection with compressed headers
+    return httpx.Client(
+        http2=config.HTTP2_ENABLED,
+        verify=_get_ssl_context(),
+        follow_redirects=True,
+        timeout=timeout,
+        limits=limits,
+        headers={
+            "User-Agent": config.USER_AGENT,
+            "Accept-Language": config.ACCEPT_LANGUAGE,
+            "Accept-Encoding": config.ACCEPT_ENCODING,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Upgrade-Insecure-Requests": "1",
             "Sec-Fetch-Dest": "document",
             "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "same-origin",
             "Sec-Fetch-User": "?1",
-            "Priority": "u=0, i"
+            "Priority": "u=0, i",
+            "Te": "trailers"
         }
+    )
+
+
+def _get_client():
+    client = getattr(_thread_local, "client", None)
+    if client is None or client.is_closed:
+        client = _create_client()
+        _thread_local.client = client
+    return client
+
+
+def warm_up():
+    """Build this thread's client (and the shared TLS context) ahead of its first account"""
+    _get_client()
+
+
+class ConforamaSession:
+    def __init__(self):
+        self.session = _get_client()
+        # Start every account from a clean cookie jar
+        self.session.cookies.clear()
+    
+    def get_login_page(self):
+        login_page_url = "https://www.conforama.es/customer/account/login?returnUrl=%2Fsales%2Forder%2Fhistory"
         
         try:
-            response = self.session.get(login_page_url, headers=headers)
+            response = self.session.get(login_page_url)
             if response.status_code == 401:
-                return "banned"
+                return BANNED
             return response.status_code == 200
         except Exception:
             return False
@@ -91,45 +138,27 @@ class ConforamaSession:
     def perform_login(self, username, password):
         login_url = "https://www.conforama.es/customer/account/login?ReturnUrl=%2Fsales%2Forder%2Fhistory"
         
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Origin": "https://www.conforama.es",
-            "Referer": "https://www.conforama.es/customer/account/login?returnUrl=%2Fsales%2Forder%2Fhistory",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-User": "?1",
-            "Priority": "u=0, i"
-        }
-        
         form_data = {
             "Login": username,
             "Password": password
         }
         
         try:
-            response = self.session.post(login_url, headers=headers, data=form_data)
+            response = self.session.post(login_url, headers=LOGIN_FORM_HEADERS, data=form_data)
             if response.status_code == 401:
-                return "banned"
-            return "sales/order/history" in str(response.url)
+                return BANNED
+            # Only the path matters; formatting the whole URL is wasted work
+            return ORDER_HISTORY_PATH in response.url.path
         except Exception:
             return False
     
     def get_order_history(self):
         order_history_url = "https://www.conforama.es/sales/order/history"
         
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-User": "?1",
-            "Priority": "u=0, i"
-        }
-        
         try:
-            response = self.session.get(order_history_url, headers=headers)
+            response = self.session.get(order_history_url)
             if response.status_code == 401:
-                return "banned"
+                return BANNED
             return response.status_code == 200
         except Exception:
             return False
@@ -137,48 +166,61 @@ class ConforamaSession:
     def get_customer_address(self):
         address_url = "https://www.conforama.es/customer/address"
         
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Referer": "https://www.conforama.es/sales/order/history",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-User": "?1",
-            "Priority": "u=0, i"
-        }
-        
         try:
-            response = self.session.get(address_url, headers=headers)
-            if response.status_code == 401:
-                return "banned"
-            if response.status_code == 200:
-                html_content = self._get_decoded_content(response)
-                return self.extract_phone_number(html_content)
-            return None
+            with self.session.stream("GET", address_url, headers=ADDRESS_HEADERS) as response:
+                if response.status_code == 401:
+                    return BANNED
+                if response.status_code != 200:
+                    return None
+                
+                # Scan the body as it arrives and stop the transfer as soon as
+                # a mobile number shows up; the rest of the page is not needed
+                buffer = bytearray()
+                scan_from = 0
+                for chunk in response.iter_bytes():
+                    buffer += chunk
+                    phone = self.extract_phone_number(buffer, scan_from, partial=True)
+                    if phone:
+                        return phone
+                    scan_from = max(0, len(buffer) - PHONE_MATCH_OVERLAP)
+                
+                return self.extract_phone_number(buffer, scan_from)
         except Exception:
             return None
     
-    def extract_phone_number(self, html_content):
-        for pattern in PHONE_PATTERNS:
-            matches = pattern.findall(html_content)
-            if matches:
-                for match in matches:
-                    phone = match
-                    if isinstance(phone, tuple):
-                        phone = phone[-1]
-                    
-                    phone = PHONE_CLEANUP_PATTERN.sub('', phone)
-                    
-                    if phone and len(phone) >= 9:
-                        digits = DIGITS_PATTERN.search(phone)
-                        if digits:
-                            number = digits.group(0)
-                            if number.startswith('6'):
-                                return number
+    def extract_phone_number(self, html_content, pos=0, partial=False):
+        if isinstance(html_content, str):
+            html_content = html_content.encode('utf-8', errors='replace')
+        
+        # The address form carries the number in an input value; a plain
+        # substring search finds that case, and the regex then only has to
+        # rule out an earlier number, so the leftmost match wins either way
+        # (the byte at the hit is included so a trailing \b sees it)
+        index = html_content.find(b'value="6', pos)
+        if index != -1:
+            start = index + 7
+            digits = html_content[start:start + 9]
+            if digits.isdigit() and html_content[start + 9:start + 10] == b'"':
+                match = PHONE_PATTERN.search(html_content, pos, index + 1)
+                if match is None:
+                    return digits.decode('ascii')
+                return match.group(1).translate(None, PHONE_SEPARATORS).decode('ascii')
+        
+        match = PHONE_PATTERN.search(html_content, pos)
+        if match is None:
+            return None
+        
+        # On a partial body a match touching the end may still grow with the
+        # next chunk, so leave it for the next scan
+        if partial and match.end() >= len(html_content):
+            return None
         
-        return None
+        return match.group(1).translate(None, PHONE_SEPARATORS).decode('ascii')
     
     def close(self):
-        self.session.close()
+        # The client stays open for the next account on this thread; only
+        # the per-account login state is dropped
+        self.session.cookies.clear()
     
     def __enter__(self):
         return self
@@ -3,8 +3,20 @@ Credential Management Module
 Handles reading and processing credentials from files
 """
 
+import mmap
 import os
-from typing import List, Tuple
+import re
+import sys
+from typing import Iterator, List, NamedTuple, Tuple, Union
+
+# Minimal shape check: one '@', no whitespace, and a dot in the domain
+EMAIL_BYTES_PATTERN = re.compile(rb'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+
+class Credential(NamedTuple):
+    """A username/password pair; unpacks like the plain tuples it replaces"""
+    username: str
+    password: str
 
 
 class CredentialManager:
@@ -13,49 +25,68 @@ class CredentialManager:
     def __init__(self, credentials_file: str = "read.txt"):
         self.credentials_file = credentials_file
     
-    def read_credentials(self) -> List[Tuple[str, str]]:
-        """Read credentials from file"""
-        credentials = []
+    def _report_skipped(self, skipped: List[Tuple[str, Union[str, bytes]]]):
+        """Report all skipped entries with a single stderr write"""
+        if not skipped:
+            return
         
+        lines = [f"⚠️ Skipped {len(skipped)} invalid credential entries:"]
+        for reason, entry in skipped:
+            if isinstance(entry, bytes):
+                entry = entry.decode('utf-8', errors='replace')
+            lines.append(f"  {reason}: {entry}")
+        sys.stderr.write("\n".join(lines) + "\n")
+    
+    def _iter_lines(self) -> Iterator[bytes]:
+        """Yield raw lines of the credentials file from a memory map"""
         if not os.path.exists(self.credentials_file):
             print(f"❌ {self.credentials_file} file not found!")
-            return []
+            return
         
         try:
-            with open(self.credentials_file, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if line and ':' in line:
-                        try:
-                            username, password = line.split(':', 1)
-                            credentials.append((username.strip(), password.strip()))
-                        except ValueError:
-                            print(f"⚠️ Invalid format on line {line_num}: {line}")
-                            continue
+            with open(self.credentials_file, 'rb') as file:
+                # mmap refuses zero-length files
+                if os.fstat(file.fileno()).st_size == 0:
+                    return
+                
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    size = len(mapped)
+                    position = 0
+                    while position < size:
+                        end = mapped.find(b'\n', position)
+                        if end == -1:
+                            end = size
+                        yield mapped[position:end]
+                        position = end + 1
         except Exception as e:
             print(f"❌ Error reading credentials: {e}")
-            return []
-        
-        return credentials
     
-    def validate_credentials(self, credentials: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
-        """Validate credential format"""
+    def get_valid_credentials(self) -> List[Credential]:
+        """Get all valid credentials from file in a single pass"""
         valid_credentials = []
-        
-        for username, password in credentials:
+        skipped = []
+        for line in self._iter_lines():
+            username, separator, password = line.partition(b':')
+            if not separator:
+                continue
+            
+            username = username.strip()
+            password = password.strip()
+            
+            # Rejected entries are kept raw and only decoded for the report
             if not username or not password:
-                print(f"⚠️ Skipping invalid credential: {username}:{password}")
+                skipped.append(("Invalid credential", username + b':' + password))
                 continue
             
-            if '@' not in username:
-                print(f"⚠️ Invalid email format: {username}")
+            # Checked on the raw bytes, before paying for the decode
+            if not EMAIL_BYTES_PATTERN.fullmatch(username):
+                skipped.append(("Invalid email format", username))
                 continue
             
-            valid_credentials.append((username, password))
+            valid_credentials.append(Credential(
+                username.decode('utf-8', errors='replace'),
+                password.decode('utf-8', errors='replace')
+            ))
         
+        self._report_skipped(skipped)
         return valid_credentials
-    
-    def get_valid_credentials(self) -> List[Tuple[str, str]]:
-        """Get all valid credentials from file"""
-        raw_credentials = self.read_credentials()
-        return self.validate_credentials(raw_credentials)
@@ -4,6 +4,7 @@ Minimal test to debug extraction worker
 """
 import sys
 import time
+from typing import List
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QThread, pyqtSignal
 
@@ -21,8 +22,9 @@ class SimpleExtractionWorker(QThread):
     def run(self):
         self.progress_signal.emit("Starting extraction test...")
         
-        def progress_callback(result: PhoneResult, completed: int, total: int):
-            self.progress_signal.emit(f"Result {completed}/{total}: {result.username} -> {result.success}")
+        def progress_callback(results: List[PhoneResult], completed: int, total: int):
+            for result in results:
+                self.progress_signal.emit(f"Result {completed}/{total}: {result.username} -> {result.success}")
         
         try:
             extractor = PhoneExtractor(max_workers=2, callback=progress_callback)
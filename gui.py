@@ -2,35 +2,44 @@
 PyQt5 GUI Interface for Conforama Phone Extractor
 """
 
+import os
 import sys
 import platform
+import tempfile
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QLabel, QPushButton, QTextEdit, 
-                            QProgressBar, QSpinBox, QFileDialog, QMessageBox,
-                            QTableWidget, QTableWidgetItem, QTabWidget,
-                            QGroupBox, QGridLayout, QLineEdit, QCheckBox)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer
-from PyQt5.QtGui import QFont, QTextCursor
+                            QHBoxLayout, QLabel, QPushButton, QPlainTextEdit, 
+                            QProgressBar, QProgressDialog, QSpinBox,
+                            QFileDialog, QMessageBox,
+                            QTableView, QHeaderView, QTabWidget,
+                            QGroupBox, QGridLayout, QLineEdit, QCheckBox,
+                            QStyledItemDelegate, QStyleOptionViewItem, QStyle)
+from PyQt5.QtCore import (QThread, pyqtSignal, Qt, QTimer,
+                          QAbstractTableModel, QModelIndex)
+from PyQt5.QtGui import QFont, QPainter, QPalette, QPixmap, QPixmapCache
 from typing import List
-import time
-import threading
+from collections import deque
 
 from credential_manager import CredentialManager
 from phone_extractor import PhoneExtractor, PhoneResult
+from line_writer import LineWriter
 import config
 
 # Detect Windows for CPU optimizations
 IS_WINDOWS = platform.system() == "Windows"
 
+# Log lines with these leading indicators are kept even in large-dataset mode
+ALWAYS_LOGGED_INDICATORS = frozenset(["✅", "🚫", "🚀", "⏹️", "🎉", "⚙️"])
+
+# Written ahead of the results in every export, already encoded
+EXPORT_HEADER = b"Conforama Phone Extraction Results\n" + b"=" * 40 + b"\n\n"
+
 
 class ExtractionWorker(QThread):
-    progress_updated = pyqtSignal(object, int, int)
-    batch_progress_updated = pyqtSignal(list, int, int)
     extraction_finished = pyqtSignal(int)
     error_occurred = pyqtSignal(str)
     startup_progress = pyqtSignal(str)
     
-    def __init__(self, credentials, max_workers=3, gui_update_batch_size=10, gui_update_interval=0.1):
+    def __init__(self, credentials, max_workers=3):
         super().__init__()
         self.credentials = credentials
         self.max_workers = max_workers
@@ -38,19 +47,10 @@ class ExtractionWorker(QThread):
         self.is_stopped = False
         self.total_accounts = len(credentials)
         
-        self.result_batch = []
-        self.last_update_time = 0
-        self.batch_lock = threading.Lock()
-        
-        # GUI update settings (platform-specific)
-        if IS_WINDOWS:
-            # More conservative settings for Windows to reduce CPU usage
-            self.gui_update_batch_size = gui_update_batch_size * 2  # Larger batches
-            self.gui_update_interval = gui_update_interval * 1.5    # Longer intervals
-        else:
-            # Standard settings for Linux/other systems
-            self.gui_update_batch_size = gui_update_batch_size
-            self.gui_update_interval = gui_update_interval
+        # Results wait here until the GUI timer drains them, so the event
+        # loop sees one update per tick instead of one signal per account.
+        # deque append/popleft are atomic, so producers never take a lock.
+        self.pending_results = deque()
     
     def run(self):
         try:
@@ -77,93 +77,299 @@ class ExtractionWorker(QThread):
         except Exception as e:
             self.error_occurred.emit(str(e))
     
-    def progress_callback(self, result: PhoneResult, completed: int, total: int):
+    def progress_callback(self, results: List[PhoneResult], completed: int, total: int):
         if self.is_stopped:
             return
+        
+        self.pending_results.append((results, completed, total))
+    
+    def take_pending_results(self) -> List:
+        # Only the GUI thread consumes, so everything counted here is
+        # still there to pop; results appended meanwhile wait for next tick
+        pending = self.pending_results
+        return [pending.popleft() for _ in range(len(pending))]
+    
+    def stop(self):
+        self.is_stopped = True
+        if self.extractor:
+            self.extractor.stop()
+
+
+class CredentialLoader(QThread):
+    credentials_loaded = pyqtSignal(list)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, credentials_file, parent=None):
+        super().__init__(parent)
+        # Own manager, so picking another file meanwhile cannot race this load
+        self.credential_manager = CredentialManager(credentials_file)
+    
+    def run(self):
+        try:
+            self.credentials_loaded.emit(self.credential_manager.get_valid_credentials())
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
+class ExportWriter(QThread):
+    progress = pyqtSignal(int)
+    export_finished = pyqtSignal(str, int)
+    export_cancelled = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, results_path, results_writer, file_path, parent=None):
+        super().__init__(parent)
+        self.results_path = results_path
+        # Still open while the extraction runs; flushed so the copy below
+        # includes every result counted so far
+        self.results_writer = results_writer
+        self.file_path = file_path
+    
+    def run(self):
+        try:
+            if self.results_writer:
+                self.results_writer.flush()
+            
+            # Results are appended a whole batch at a time, so the size taken
+            # now ends on a line even while the extraction keeps writing
+            total = os.path.getsize(self.results_path)
+            copied = 0
+            exported = 0
             
-        current_time = time.time()
+            cancelled = False
+            
+            # The destination is buffered, so each write is taken in full
+            with open(self.results_path, 'rb', buffering=0) as src, \
+                    open(self.file_path, 'wb') as dst:
+                dst.write(EXPORT_HEADER)
+                
+                while copied < total:
+                    if self.isInterruptionRequested():
+                        cancelled = True
+                        break
+                    
+                    chunk = src.read(min(config.EXPORT_CHUNK_SIZE, total - copied))
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    copied += len(chunk)
+                    exported += chunk.count(b"\n")
+                    self.progress.emit(copied * 100 // total)
+            
+            # A cancelled export leaves no partial file behind
+            if cancelled:
+                os.remove(self.file_path)
+                self.export_cancelled.emit(self.file_path)
+                return
+            
+            self.export_finished.emit(self.file_path, exported)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
+class PhoneResultsModel(QAbstractTableModel):
+    """Table model over the extraction results; the view only asks for visible rows"""
+    
+    HEADERS = ["Username", "Password", "Phone Number", "Status"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One list of display strings per column, filled once per row, so
+        # data() is a plain double index with no attribute lookups
+        self.usernames = []
+        self.masked_passwords = []
+        self.phones = []
+        self.statuses = []
+        self.columns = (self.usernames, self.masked_passwords, self.phones, self.statuses)
+        # Rows the view has been told about; stored rows beyond this stay
+        # invisible (and unpainted) until publish_rows() announces them
+        self.published_rows = 0
         
-        # For real-time feedback, send more results immediately
-        if completed <= 200:
-            # First 200 results always immediate
-            self.batch_progress_updated.emit([(result, completed, total)], completed, total)
+        self.na_item = "N/A"
+        self.success_item = "✅ Success"
+        self.banned_item = "🚫 BANNED"
+        # Masks for every realistic password length exist up front
+        self.password_masks = {length: "*" * length for length in range(65)}
+        # Failures repeat a handful of messages; rows share one string each
+        self.failure_statuses = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.published_rows
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self.columns[index.column()][index.row()]
+    
+    def status_text(self, result: PhoneResult) -> str:
+        if result.success:
+            return self.success_item
+        if result.banned:
+            return self.banned_item
+        
+        status = self.failure_statuses.get(result.error)
+        if status is None:
+            status = self.failure_statuses[result.error] = f"❌ {result.error}"
+        return status
+    
+    def get_password_mask(self, password_length: int) -> str:
+        mask = self.password_masks.get(password_length)
+        if mask is None:
+            mask = self.password_masks[password_length] = "*" * password_length
+        return mask
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.publish_rows()
+        self.layoutAboutToBeChanged.emit()
+        keys = self.columns[column]
+        rows = sorted(
+            range(len(keys)),
+            key=keys.__getitem__,
+            reverse=order == Qt.DescendingOrder
+        )
+        for values in self.columns:
+            values[:] = [values[row] for row in rows]
+        self.layoutChanged.emit()
+    
+    def stored_rows(self) -> int:
+        return len(self.usernames)
+    
+    def append_results(self, results: List[PhoneResult], publish: bool = True):
+        # Each column grows once per batch rather than once per row
+        self.usernames.extend([result.username for result in results])
+        self.masked_passwords.extend([self.get_password_mask(len(result.password)) for result in results])
+        self.phones.extend([result.phone if result.success else self.na_item for result in results])
+        self.statuses.extend([self.status_text(result) for result in results])
+        
+        if publish:
+            self.publish_rows()
+    
+    def publish_rows(self):
+        total = len(self.usernames)
+        if total == self.published_rows:
             return
         
-        # For large datasets, continue immediate updates longer for real-time logs
-        if total > 50000 and completed <= 1000:
-            self.batch_progress_updated.emit([(result, completed, total)], completed, total)
-            return
-        elif total > 10000 and completed <= 500:
-            self.batch_progress_updated.emit([(result, completed, total)], completed, total)
+        self.beginInsertRows(QModelIndex(), self.published_rows, total - 1)
+        self.published_rows = total
+        self.endInsertRows()
+    
+    def clear(self):
+        self.beginResetModel()
+        for values in self.columns:
+            values.clear()
+        self.published_rows = 0
+        self.failure_statuses.clear()
+        self.endResetModel()
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """Paints status cells from pixmaps cached per distinct text and cell size"""
+    
+    def paint(self, painter, option, index):
+        text = index.data()
+        if not text:
+            super().paint(painter, option, index)
             return
         
-        with self.batch_lock:
-            self.result_batch.append((result, completed, total))
+        # Background, selection and focus still come from the style
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+        
+        selected = bool(option.state & QStyle.State_Selected)
+        size = option.rect.size()
+        key = f"status:{text}:{size.width()}x{size.height()}:{int(selected)}"
+        
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            ratio = painter.device().devicePixelRatioF()
+            pixmap = QPixmap(size * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
             
-            # More aggressive batching for real-time feedback
-            force_early_update = (completed <= 200) or (completed % 10 == 0)
+            role = QPalette.HighlightedText if selected else QPalette.Text
+            text_rect = pixmap.rect()
+            text_rect.setSize(size)
+            text_rect.adjust(3, 0, -3, 0)
             
-            should_update = (
-                len(self.result_batch) >= self.gui_update_batch_size or
-                current_time - self.last_update_time >= self.gui_update_interval or
-                completed == total or
-                force_early_update
-            )
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setFont(option.font)
+            pixmap_painter.setPen(option.palette.color(role))
+            elided = option.fontMetrics.elidedText(text, Qt.ElideRight, text_rect.width())
+            pixmap_painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, elided)
+            pixmap_painter.end()
             
-            if should_update:
-                batch_copy = self.result_batch.copy()
-                self.result_batch.clear()
-                self.last_update_time = current_time
-                
-                self.batch_progress_updated.emit(batch_copy, completed, total)
-    
-    def stop(self):
-        self.is_stopped = True
-        if self.extractor:
-            self.extractor.stop()
+            QPixmapCache.insert(key, pixmap)
+        
+        painter.drawPixmap(option.rect.topLeft(), pixmap)
 
 
 class ConforamaGUI(QMainWindow):
+    # Emitted from a writer's own thread once it has closed its file
+    phone_writer_closed = pyqtSignal(object)
+    
     
     def __init__(self):
         super().__init__()
         self.credential_manager = CredentialManager()
         self.extraction_worker = None
+        self.credential_loader = None
+        self.export_writer = None
         self.credentials = []
         
         self.successful_count = 0
         self.failed_count = 0
         self.banned_count = 0
-        
-        self.export_data = []
-        
-        self.pending_table_updates = []
-        self.last_table_update_time = 0
-        
-        self.log_entries = []
+        # Progress seen by the previous batch; periodic actions fire when a
+        # batch crosses one of their multiples
+        self.last_completed = 0
+        
+        # Exportable results are streamed to a temporary file as they arrive
+        # instead of being kept in memory
+        self.results_path = None
+        self.results_writer = None
+        self.export_count = 0
+        self.phone_writer = None
+        self.phone_writer_closed.connect(self.on_phone_writer_closed)
+        
+        self.max_log_lines = config.MAX_LOG_LINES // 2 if IS_WINDOWS else config.MAX_LOG_LINES
+        # Lines waiting for the next tick; a burst longer than the view keeps
+        # is trimmed here, before any of it is laid out
+        self._log_buffer = deque(maxlen=self.max_log_lines)
         self.is_large_dataset = False
         
-        # Instance-specific GUI update settings (platform-aware)
+        # How often queued results are drained into the GUI (platform-aware)
         if IS_WINDOWS:
             # More conservative settings for Windows
-            self.gui_update_batch_size = config.GUI_UPDATE_BATCH_SIZE * 2
             self.gui_update_interval = config.GUI_UPDATE_INTERVAL * 2
         else:
             # Standard settings for Linux/other systems
-            self.gui_update_batch_size = config.GUI_UPDATE_BATCH_SIZE
             self.gui_update_interval = config.GUI_UPDATE_INTERVAL
         
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.flush_pending_updates)
         self.update_timer.start(int(self.gui_update_interval * 1000))
         
-        self.na_item = "N/A"
-        self.success_item = "✅ Success"
-        self.banned_item = "🚫 BANNED"
-        self.password_masks = {}
+        # Live statistics are refreshed at a fixed, slower rate from the
+        # latest progress, however many batches arrive in between
+        self.pending_stats = None
+        self.stats_timer = QTimer()
+        self.stats_timer.timeout.connect(self.refresh_live_stats)
+        self.stats_timer.start(config.STATS_UPDATE_INTERVAL_MS)
         
         self.init_ui()
-        self.load_credentials()
+        # Start loading once the event loop runs, so the window paints first
+        QTimer.singleShot(0, self.load_credentials)
     
     def init_ui(self):
         self.setWindowTitle(config.WINDOW_TITLE)
@@ -173,68 +379,62 @@ class ConforamaGUI(QMainWindow):
         self.setCentralWidget(central_widget)
         
         tab_widget = QTabWidget()
+        self.tab_widget = tab_widget
         
         main_tab = self.create_main_tab()
         tab_widget.addTab(main_tab, "📞 Extractor")
         
-        results_tab = self.create_results_tab()
-        tab_widget.addTab(results_tab, "📊 Results")
+        self.results_tab = self.create_results_tab()
+        tab_widget.addTab(self.results_tab, "📊 Results")
         
         settings_tab = self.create_settings_tab()
         tab_widget.addTab(settings_tab, "⚙️ Settings")
         
+        tab_widget.currentChanged.connect(self.on_tab_changed)
+        
         main_layout = QVBoxLayout()
         main_layout.addWidget(tab_widget)
         central_widget.setLayout(main_layout)
         
         self.statusBar().showMessage("Ready")
     
-    def limit_log_lines(self, max_lines: int = None):
-        if max_lines is None:
-            # Use platform-specific log limits
-            max_lines = config.MAX_LOG_LINES // 2 if IS_WINDOWS else config.MAX_LOG_LINES
-            
-        document = self.log_text.document()
-        
-        if document.lineCount() > max_lines:
-            lines_to_remove = document.lineCount() - max_lines
-            
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(QTextCursor.Start)
-            
-            for _ in range(lines_to_remove):
-                cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor)
-            
-            cursor.removeSelectedText()
-            
-            if cursor.position() > 0:
-                cursor.deletePreviousChar()
+    def on_tab_changed(self, index: int):
+        # Rows collected while the table was hidden are announced in one go
+        if self.tab_widget.widget(index) is self.results_tab:
+            self.results_model.publish_rows()
+            self.results_table.scrollToBottom()
     
-    def add_log_message(self, message: str):
+    def should_log(self, indicator: str, failed_count: int) -> bool:
         # For large datasets, show logs more selectively but still in real-time
-        if self.is_large_dataset:
-            # Show important messages and some failures for real-time feedback
-            if any(indicator in message for indicator in ["✅", "🚫", "🚀", "⏹️", "🎉", "⚙️"]):
-                # Always show successes, bans, and system messages
-                pass
-            elif "❌" in message and (self.failed_count % 20 == 0 or self.failed_count < 500):
-                # Show every 20th failure for real-time progress indication OR first 500 failures
-                pass
-            else:
-                # Skip routine failure messages to reduce spam
-                return
+        if not self.is_large_dataset:
+            return True
         
-        self.log_entries.append(message)
+        # Always show successes, bans, and system messages
+        if indicator in ALWAYS_LOGGED_INDICATORS:
+            return True
         
-        if len(self.log_entries) > config.MAX_LOG_ENTRIES:
-            self.log_entries = self.log_entries[-config.MAX_LOG_ENTRIES:]
-            
-        self.log_text.append(message)
-        self.limit_log_lines()
+        # Show every 20th failure for real-time progress indication OR first 500 failures;
+        # skip routine failure messages to reduce spam
+        return indicator == "❌" and (failed_count % 20 == 0 or failed_count < 500)
+    
+    def add_log_message(self, message: str):
+        # Every message starts with its indicator; some (⚙️, ⏹️) span two code
+        # points, so the whole first word is compared rather than one character
+        if self.should_log(message.partition(" ")[0], self.failed_count):
+            self.add_log_lines([message])
+    
+    def add_log_lines(self, lines: List[str]):
+        self._log_buffer.extend(lines)
+    
+    def flush_log(self):
+        if not self._log_buffer:
+            return
         
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.log_text.setTextCursor(cursor)
+        # One append (and one layout pass) for everything logged since the
+        # last tick; appended as plain text, so a tag-like username cannot
+        # turn the batch into HTML, and the view stays pinned to the end
+        self.log_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
     
     def create_main_tab(self):
         tab = QWidget()
@@ -304,9 +504,11 @@ class ConforamaGUI(QMainWindow):
         log_group = QGroupBox("📋 Log")
         log_layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(200)
         self.log_text.setReadOnly(True)
+        # The document drops its oldest lines itself once the limit is hit
+        self.log_text.document().setMaximumBlockCount(self.max_log_lines)
         log_layout.addWidget(self.log_text)
         
         log_group.setLayout(log_layout)
@@ -326,10 +528,26 @@ class ConforamaGUI(QMainWindow):
         title.setFont(title_font)
         layout.addWidget(title)
         
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels(["Username", "Password", "Phone Number", "Status"])
-        self.results_table.horizontalHeader().setStretchLastSection(True)
+        self.results_model = PhoneResultsModel()
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        
+        # Fixed widths, so the header never measures cell text as rows arrive
+        header = self.results_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        for column, width in enumerate(config.RESULTS_COLUMN_WIDTHS):
+            self.results_table.setColumnWidth(column, width)
+        
+        # Every row is a single line of text, so one height fits all and the
+        # view never asks the model for per-row size hints
+        rows_header = self.results_table.verticalHeader()
+        rows_header.setSectionResizeMode(QHeaderView.Fixed)
+        rows_header.setDefaultSectionSize(config.RESULTS_ROW_HEIGHT)
+        
+        # Status cells repeat a few strings; each is laid out once, then blitted
+        QPixmapCache.setCacheLimit(config.STATUS_PIXMAP_CACHE_KB)
+        self.status_delegate = StatusDelegate(self.results_table)
+        self.results_table.setItemDelegateForColumn(3, self.status_delegate)
         
         self.results_table.setAlternatingRowColors(True)
         self.results_table.setSortingEnabled(False)
@@ -384,18 +602,37 @@ class ConforamaGUI(QMainWindow):
         return tab
     
     def load_credentials(self):
-        try:
-            self.credentials = self.credential_manager.get_valid_credentials()
-            if self.credentials:
-                self.cred_info.setText(f"✅ {len(self.credentials)} accounts loaded")
-                self.start_btn.setEnabled(True)
-            else:
-                self.cred_info.setText("❌ No valid credentials found")
-                self.start_btn.setEnabled(False)
-        except Exception as e:
-            self.cred_info.setText(f"❌ Error loading credentials: {str(e)}")
+        # Parsing runs off the GUI thread; large files no longer freeze the window
+        self.cred_info.setText("⏳ Loading...")
+        self.start_btn.setEnabled(False)
+        
+        loader = CredentialLoader(self.credential_manager.credentials_file, self)
+        loader.credentials_loaded.connect(self.on_credentials_loaded)
+        loader.error_occurred.connect(self.on_credentials_error)
+        loader.finished.connect(loader.deleteLater)
+        self.credential_loader = loader
+        loader.start()
+    
+    def on_credentials_loaded(self, credentials: List):
+        # A newer load was started meanwhile; its result is the one that counts
+        if self.sender() is not self.credential_loader:
+            return
+        
+        self.credentials = credentials
+        if self.credentials:
+            self.cred_info.setText(f"✅ {len(self.credentials)} accounts loaded")
+            self.start_btn.setEnabled(True)
+        else:
+            self.cred_info.setText("❌ No valid credentials found")
             self.start_btn.setEnabled(False)
     
+    def on_credentials_error(self, error: str):
+        if self.sender() is not self.credential_loader:
+            return
+        
+        self.cred_info.setText(f"❌ Error loading credentials: {error}")
+        self.start_btn.setEnabled(False)
+    
     def load_credentials_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select Credentials File", "", "Text Files (*.txt);;All Files (*)"
@@ -425,22 +662,15 @@ class ConforamaGUI(QMainWindow):
         if self.is_large_dataset:
             self.add_log_message(f"🔍 Large dataset detected ({credential_count} accounts) - Enabling memory optimizations")
             
-            # Use reasonable batch sizes that work well on both Windows and Linux
+            # Everything queued since the last tick is applied at once, so the
+            # drain interval alone sets how often the GUI updates; use more
+            # conservative intervals on Windows to prevent CPU spikes
             if credential_count > 50000:
-                self.gui_update_batch_size = 5  # Moderate batch size for massive datasets
-                self.gui_update_interval = 0.1  # 100ms interval
-                self.add_log_message(f"⚙️ Massive dataset - using batch size: {self.gui_update_batch_size}")
-            elif credential_count > 10000:
-                self.gui_update_batch_size = 8  # Medium batch size for very large datasets
-                self.gui_update_interval = 0.12  # 120ms interval
-                self.add_log_message(f"⚙️ Very large dataset - using batch size: {self.gui_update_batch_size}")
+                self.gui_update_interval = 0.2 if IS_WINDOWS else 0.1
+                self.add_log_message(f"⚙️ Massive dataset - draining results every {self.gui_update_interval}s")
             else:
-                self.gui_update_batch_size = 10  # Normal batch size for large datasets
-                self.gui_update_interval = 0.15  # 150ms interval
-                self.add_log_message(f"⚙️ Large dataset - using batch size: {self.gui_update_batch_size}")
-            
-            # Force immediate GUI update after setting parameters
-            QApplication.processEvents()
+                self.gui_update_interval = 0.25 if IS_WINDOWS else 0.15
+                self.add_log_message(f"⚙️ Large dataset - draining results every {self.gui_update_interval}s")
             
             reply = QMessageBox.question(
                 self, 
@@ -448,8 +678,7 @@ class ConforamaGUI(QMainWindow):
                 f"You're about to process {credential_count} accounts.\n\n"
                 f"Large dataset optimizations will be enabled:\n"
                 f"• Reduced logging frequency\n"
-                f"• Larger GUI update batches ({self.gui_update_batch_size} items)\n"
-                f"• Update interval: {self.gui_update_interval}s\n"
+                f"• Queued results applied together every {self.gui_update_interval}s\n"
                 f"• Memory-efficient processing\n\n"
                 f"Continue?",
                 QMessageBox.Yes | QMessageBox.No,
@@ -464,68 +693,71 @@ class ConforamaGUI(QMainWindow):
         self.progress_bar.setMaximum(len(self.credentials))
         self.progress_bar.setValue(0)
         self.log_text.clear()
+        self._log_buffer.clear()
         
-        self.results_table.setRowCount(0)
+        self.results_model.clear()
         self.results_table.setUpdatesEnabled(True)
         self.results_table.setSortingEnabled(False)
         
-        self.export_data = []
-        self.log_entries = []
+        self.open_results_file()
         
         self.successful_count = 0
         self.failed_count = 0
         self.banned_count = 0
+        # Progress seen by the previous batch; periodic actions fire when a
+        # batch crosses one of their multiples
+        self.last_completed = 0
         
         # Restart timer with new interval if efficient mode is enabled
         if self.is_large_dataset and hasattr(self, 'update_timer'):
             self.update_timer.stop()
-            # Use more conservative timer intervals on Windows to prevent CPU spikes
-            if credential_count > 50000:
-                timer_interval = 200 if IS_WINDOWS else 100  # More conservative on Windows
-            else:
-                timer_interval = 250 if IS_WINDOWS else 150  # More conservative on Windows
-            self.update_timer.start(timer_interval)
-            self.add_log_message(f"⚙️ Timer restarted with {timer_interval/1000}s interval")
+            self.update_timer.start(int(self.gui_update_interval * 1000))
+            self.add_log_message(f"⚙️ Timer restarted with {self.gui_update_interval}s interval")
             if IS_WINDOWS:
                 self.add_log_message("⚙️ Windows detected - using CPU-friendly timers")
             self.add_log_message(f"⚙️ Timer active: {self.update_timer.isActive()}")
         else:
             self.add_log_message(f"⚙️ Normal mode - using default timer interval")
         
-        max_workers = self.thread_spinbox.value()
-        self.extraction_worker = ExtractionWorker(
-            self.credentials, 
-            max_workers, 
-            self.gui_update_batch_size, 
-            self.gui_update_interval
+        self.phone_writer = LineWriter(
+            config.PHONES_FILE, fsync=True, on_closed=self.phone_writer_closed.emit
         )
-        self.extraction_worker.progress_updated.connect(self.on_progress_updated)
-        self.extraction_worker.batch_progress_updated.connect(self.on_batch_progress_updated)
+        
+        max_workers = self.thread_spinbox.value()
+        self.extraction_worker = ExtractionWorker(self.credentials, max_workers)
         self.extraction_worker.extraction_finished.connect(self.on_extraction_finished)
         self.extraction_worker.error_occurred.connect(self.on_error_occurred)
         self.extraction_worker.startup_progress.connect(self.on_startup_progress)
+        self.extraction_worker.finished.connect(self.on_worker_finished)
         self.extraction_worker.start()
         
-        # Force immediate processing of pending events
-        QApplication.processEvents()
-        
         optimization_text = " + memory optimizations" if self.is_large_dataset else ""
         self.add_log_message(f"🚀 Started extraction with {max_workers} threads (optimized startup + batched updates{optimization_text})")
         self.statusBar().showMessage("Initializing optimized extraction...")
         
-        # Force immediate GUI update
         if self.is_large_dataset:
             self.add_log_message("⚙️ Large dataset mode active - initializing...")
-            self.add_log_message(f"⚙️ Will show updates every {self.gui_update_batch_size} results or {self.gui_update_interval}s")
-            QApplication.processEvents()  # Force GUI update
+            self.add_log_message(f"⚙️ Will apply queued results every {self.gui_update_interval}s")
     
     def stop_extraction(self):
-        if hasattr(self, 'update_timer'):
-            self.update_timer.stop()
-            
+        # Requests already in flight are left to finish in the background;
+        # the rest of the teardown happens in on_worker_finished
         if self.extraction_worker:
             self.extraction_worker.stop()
-            self.extraction_worker.wait()
+        
+        self.stop_btn.setEnabled(False)
+        self.statusBar().showMessage("Stopping...")
+    
+    def on_worker_finished(self):
+        # Results queued before the run ended (stop or error included) still
+        # go to the writers, so every phone of the run is written by now
+        self.apply_pending_results()
+        self.close_phones_file()
+        self.close_results_file()
+        
+        # Completed runs and errors are handled by their own signals
+        if not self.extraction_worker.is_stopped:
+            return
         
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
@@ -533,126 +765,121 @@ class ConforamaGUI(QMainWindow):
         self.add_log_message("⏹️ Extraction stopped by user")
         
         # Reset GUI update settings to default
-        self.gui_update_batch_size = config.GUI_UPDATE_BATCH_SIZE
         self.gui_update_interval = config.GUI_UPDATE_INTERVAL
         
         if hasattr(self, 'update_timer'):
             self.update_timer.start(int(self.gui_update_interval * 1000))
     
-    def write_phone_immediately(self, phone: str):
-        try:
-            with open("phones.txt", "a", encoding="utf-8") as f:
-                f.write(f"{phone}\n")
-            self.add_log_message(f"📱 Phone {phone} written to phones.txt immediately")
-        except Exception as e:
-            self.add_log_message(f"⚠️ Failed to write phone {phone} to file: {e}")
-    
-    def get_password_mask(self, password_length: int) -> str:
-        if password_length not in self.password_masks:
-            self.password_masks[password_length] = "*" * password_length
-        return self.password_masks[password_length]
+    def write_phones(self, phones: List[str]):
+        # Handed to the writer thread; the GUI thread never touches the file
+        if self.phone_writer:
+            self.phone_writer.write(phones)
     
-    def add_result_to_table(self, result: PhoneResult):
-        if not result.success and not result.banned and "Login failed" in result.error:
+    def close_phones_file(self, wait: bool = False):
+        if self.phone_writer is None:
             return
         
-        if self.is_large_dataset and self.results_table.rowCount() >= config.MAX_TABLE_ROWS:
+        # The final write and fsync finish on the writer thread; errors are
+        # reported through phone_writer_closed instead of blocking here
+        self.phone_writer.close(wait=wait)
+        self.phone_writer = None
+    
+    def on_phone_writer_closed(self, writer: LineWriter):
+        if writer.error:
+            self.add_log_message(f"⚠️ Failed to write phones to file: {writer.error}")
+    
+    def open_results_file(self):
+        self.discard_results_file()
+        
+        fd, self.results_path = tempfile.mkstemp(prefix="conforama_results_", suffix=".txt")
+        os.close(fd)
+        # Throwaway file: no fsync, so closing it never waits on the disk
+        self.results_writer = LineWriter(self.results_path)
+        self.export_count = 0
+    
+    def write_results(self, lines: List[str]):
+        if self.results_writer and lines:
+            self.results_writer.write(lines)
+            self.export_count += len(lines)
+    
+    def close_results_file(self):
+        if self.results_writer is None:
             return
         
-        if result.success:
-            phone_display = result.phone
-            status_display = self.success_item
-        elif result.banned:
-            phone_display = self.na_item
-            status_display = self.banned_item
-        else:
-            phone_display = self.na_item
-            status_display = f"❌ {result.error}"
-        
-        row_position = self.results_table.rowCount()
-        self.results_table.insertRow(row_position)
-        self.results_table.setItem(row_position, 0, QTableWidgetItem(result.username))
-        self.results_table.setItem(row_position, 1, QTableWidgetItem(self.get_password_mask(len(result.password))))
-        self.results_table.setItem(row_position, 2, QTableWidgetItem(phone_display))
-        self.results_table.setItem(row_position, 3, QTableWidgetItem(status_display))
+        self.results_writer.close()
+        if self.results_writer.error:
+            self.add_log_message(f"⚠️ Failed to store results for export: {self.results_writer.error}")
+        self.results_writer = None
     
-    def on_progress_updated(self, result: PhoneResult, completed: int, total: int):
-        self.progress_bar.setValue(completed)
-        self.progress_label.setText(f"Processing {completed}/{total}: {result.username}")
-        
-        self.add_result_to_table(result)
-        
-        if result.success:
-            self.add_log_message(f"✅ {result.username} -> {result.phone}")
-            
-            self.write_phone_immediately(result.phone)
-            
-            self.export_data.append({
-                'username': result.username,
-                'password': result.password,
-                'phone': result.phone
-            })
-            self.successful_count += 1
-        elif result.banned:
-            self.add_log_message(f"🚫 {result.username} -> BANNED (401)")
-            self.banned_count += 1
-        elif result.username == "" and result.password == "":
-            # System message - always show
-            self.add_log_message(f"⚙️ {result.error}")
-        else:
-            self.add_log_message(f"❌ {result.username} -> {result.error}")
-            self.failed_count += 1
-        
-        self.update_live_stats(completed, total)
+    def discard_results_file(self):
+        self.close_results_file()
+        if self.results_path is None:
+            return
         
-        if completed % 10 == 0 or completed == total:
-            self.results_table.scrollToBottom()
+        try:
+            os.remove(self.results_path)
+        except OSError:
+            pass
+        self.results_path = None
     
-    def on_batch_progress_updated(self, batch_results: List, completed: int, total: int):
-        # Disable table updates during batch processing on Windows for better performance
-        if IS_WINDOWS and self.is_large_dataset:
-            self.results_table.setUpdatesEnabled(False)
-            self.results_table.setSortingEnabled(False)
-        elif self.is_large_dataset:
-            self.results_table.setUpdatesEnabled(False)
-            self.results_table.setSortingEnabled(False)
-        
-        for result, result_completed, result_total in batch_results:
-            self.add_result_to_table(result)
-            
+    def apply_result_batch(self, batch_results: List[PhoneResult], completed: int, total: int):
+        # Hold repaints until the whole batch is in, whatever the dataset size:
+        # the view then paints once per batch instead of once per row
+        self.results_table.setUpdatesEnabled(False)
+        
+        phones = []
+        export_lines = []
+        log_lines = []
+        successful = failed = banned = 0
+        for result in batch_results:
             if result.success:
-                self.add_log_message(f"✅ {result.username} -> {result.phone}")
-                
-                self.write_phone_immediately(result.phone)
+                log_lines.append(f"✅ {result.username} -> {result.phone}")
                 
-                self.export_data.append({
-                    'username': result.username,
-                    'password': result.password,
-                    'phone': result.phone
-                })
-                self.successful_count += 1
+                phones.append(result.phone)
+                export_lines.append(f"{result.username}:{result.password}:{result.phone}")
+                successful += 1
             elif result.banned:
-                self.add_log_message(f"🚫 {result.username} -> BANNED (401)")
-                self.banned_count += 1
+                log_lines.append(f"🚫 {result.username} -> BANNED (401)")
+                banned += 1
             elif result.username == "" and result.password == "":
                 # System message - always show
-                self.add_log_message(f"⚙️ {result.error}")
+                log_lines.append(f"⚙️ {result.error}")
             else:
-                # Always call add_log_message - it will handle filtering internally
-                self.add_log_message(f"❌ {result.username} -> {result.error}")
-                self.failed_count += 1
-        
+                # Sampled against the running count, as if counted row by row;
+                # skipped lines are never formatted
+                if self.should_log("❌", self.failed_count + failed):
+                    log_lines.append(f"❌ {result.username} -> {result.error}")
+                failed += 1
+        
+        # Counters and log take one update each for the whole batch
+        self.successful_count += successful
+        self.failed_count += failed
+        self.banned_count += banned
+        self.add_log_lines(log_lines)
+        
+        self.write_phones(phones)
+        self.write_results(export_lines)
+        
+        # Plain login failures never reach the table; filter the batch in one
+        # pass and, on large runs, stop at the row cap
+        table_rows = [
+            result for result in batch_results
+            if result.success or result.banned or "Login failed" not in result.error
+        ]
         if self.is_large_dataset:
-            self.results_table.setUpdatesEnabled(True)
+            table_rows = table_rows[:max(0, config.MAX_TABLE_ROWS - self.results_model.stored_rows())]
+        # While another tab is showing, rows are only stored, not painted
+        self.results_model.append_results(
+            table_rows,
+            publish=self.tab_widget.currentWidget() is self.results_tab
+        )
         
-        self.progress_bar.setValue(completed)
+        self.results_table.setUpdatesEnabled(True)
         
-        if self.is_large_dataset:
-            self.progress_label.setText(f"Processing {completed}/{total} ({(completed/total*100):.1f}% complete)")
-        else:
-            self.progress_label.setText(f"Processing {completed}/{total} (batch of {len(batch_results)} results)")
+        self.progress_bar.setValue(completed)
         
-        self.update_live_stats(completed, total)
+        # Label text is formatted by the stats timer, not once per batch
+        self.pending_stats = (completed, total)
         
         # Platform-specific scroll frequency optimization
         if IS_WINDOWS:
@@ -660,25 +887,31 @@ class ConforamaGUI(QMainWindow):
         else:
             scroll_frequency = 50 if self.is_large_dataset else 10   # Standard frequency
             
-        if completed % scroll_frequency == 0 or completed == total:
-            self.results_table.scrollToBottom()
+        # A batch covers many accounts, so look for a crossed multiple rather
+        # than landing exactly on one
+        previous = self.last_completed
+        self.last_completed = completed
         
-        # Force GUI updates more frequently for real-time logs, but less on Windows
-        if IS_WINDOWS:
-            # On Windows, update GUI less frequently to reduce CPU usage
-            if completed % 100 == 0:  # Every 100 results on Windows
-                QApplication.processEvents()
-        else:
-            # On Linux/other systems, more frequent updates are fine
-            if completed % 25 == 0:  # Every 25 results on Linux
-                QApplication.processEvents()
+        if completed // scroll_frequency != previous // scroll_frequency or completed == total:
+            self.results_table.scrollToBottom()
         
         # Show periodic status updates for large datasets
-        if self.is_large_dataset and completed % 2000 == 0:
+        if self.is_large_dataset and completed // 2000 != previous // 2000:
             self.add_log_message(f"⚙️ Progress: {completed}/{total} ({(completed/total*100):.1f}% complete)")
-            # Reduce frequency of processEvents calls on Windows to prevent CPU spikes
-            if completed % (8000 if IS_WINDOWS else 4000) == 0:
-                QApplication.processEvents()  # Less frequent GUI updates on Windows
+    
+    def refresh_live_stats(self):
+        if self.pending_stats is None:
+            return
+        
+        completed, total = self.pending_stats
+        self.pending_stats = None
+        
+        if self.is_large_dataset:
+            self.progress_label.setText(f"Processing {completed}/{total} ({(completed/total*100):.1f}% complete)")
+        else:
+            self.progress_label.setText(f"Processing {completed}/{total}")
+        
+        self.update_live_stats(completed, total)
     
     def update_live_stats(self, completed: int, total: int):
         success_rate = (self.successful_count / completed * 100) if completed > 0 else 0
@@ -696,16 +929,14 @@ Success rate: {success_rate:.1f}%
     
     def on_extraction_finished(self, total_accounts: int):
         self.flush_pending_updates()
-        
-        if self.is_large_dataset:
-            self.cleanup_memory()
-            self.add_log_message(f"🧹 Final cleanup completed for large dataset ({total_accounts} accounts)")
+        # Bring the progress label up to date now; the final summary below
+        # then replaces the live statistics
+        self.refresh_live_stats()
         
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         
         # Reset GUI update settings to default
-        self.gui_update_batch_size = config.GUI_UPDATE_BATCH_SIZE
         self.gui_update_interval = config.GUI_UPDATE_INTERVAL
         
         self.results_table.setSortingEnabled(True)
@@ -750,86 +981,90 @@ Success rate: {(self.successful_count/total_accounts*100):.1f}%
         QMessageBox.critical(self, "Error", f"An error occurred:\n{error}")
     
     def export_results(self):
-        if not self.export_data:
+        if not self.export_count:
             QMessageBox.warning(self, "Warning", "No results to export!")
             return
         
+        if self.export_writer is not None:
+            QMessageBox.warning(self, "Warning", "An export is already running!")
+            return
+        
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Export Results", "results.txt", "Text Files (*.txt);;All Files (*)"
         )
         
         if file_path:
-            try:
-                total_results = len(self.export_data)
-                
-                progress_dialog = None
-                if total_results > config.EXPORT_CHUNK_SIZE:
-                    progress_dialog = QMessageBox(self)
-                    progress_dialog.setWindowTitle("Exporting Results")
-                    progress_dialog.setText(f"Exporting {total_results} results...")
-                    progress_dialog.setStandardButtons(QMessageBox.NoButton)
-                    progress_dialog.show()
-                    QApplication.processEvents()
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("Conforama Phone Extraction Results\n")
-                    f.write("=" * 40 + "\n\n")
-                    
-                    for i in range(0, total_results, config.EXPORT_CHUNK_SIZE):
-                        chunk = self.export_data[i:i + config.EXPORT_CHUNK_SIZE]
-                        
-                        if progress_dialog:
-                            progress_dialog.setText(f"Exporting {i + len(chunk)}/{total_results} results...")
-                            QApplication.processEvents()
-                        
-                        for item in chunk:
-                            f.write(f"{item['username']}:{item['password']}:{item['phone']}\n")
-                
-                if progress_dialog:
-                    progress_dialog.close()
-                
-                QMessageBox.information(
-                    self, 
-                    "Export Complete", 
-                    f"Results exported to {file_path}\n\n"
-                    f"Exported {len(self.export_data)} phone numbers."
-                )
-                
-            except Exception as e:
-                if progress_dialog:
-                    progress_dialog.close()
-                QMessageBox.critical(self, "Export Error", f"Failed to export results:\n{str(e)}")
+            # The file is written off the GUI thread; the dialog only follows
+            # the writer's progress signals
+            progress_dialog = QProgressDialog(
+                "Exporting results...", "Cancel", 0, 100, self
+            )
+            progress_dialog.setWindowTitle("Exporting Results")
+            progress_dialog.setWindowModality(Qt.WindowModal)
+            progress_dialog.setMinimumDuration(0)
+            progress_dialog.setAutoClose(False)
+            progress_dialog.setAutoReset(False)
+            
+            writer = ExportWriter(self.results_path, self.results_writer, file_path, self)
+            writer.progress.connect(progress_dialog.setValue)
+            writer.export_finished.connect(self.on_export_finished)
+            writer.export_cancelled.connect(self.on_export_cancelled)
+            writer.error_occurred.connect(self.on_export_error)
+            writer.finished.connect(progress_dialog.close)
+            writer.finished.connect(self.on_export_writer_finished)
+            progress_dialog.canceled.connect(writer.requestInterruption)
+            self.export_writer = writer
+            writer.start()
+    
+    def on_export_finished(self, file_path: str, exported: int):
+        QMessageBox.information(
+            self, 
+            "Export Complete", 
+            f"Results exported to {file_path}\n\n"
+            f"Exported {exported} phone numbers."
+        )
+    
+    def on_export_cancelled(self, file_path: str):
+        QMessageBox.information(
+            self, 
+            "Export Cancelled", 
+            f"Export was cancelled; {file_path} was not written."
+        )
+    
+    def on_export_error(self, error: str):
+        QMessageBox.critical(self, "Export Error", f"Failed to export results:\n{error}")
+    
+    def on_export_writer_finished(self):
+        self.export_writer.deleteLater()
+        self.export_writer = None
+    
+    def closeEvent(self, event):
+        # Phones already reported as found still reach phones.txt when the
+        # window closes mid-run; the results file only lives as long as the window
+        if self.extraction_worker:
+            self.apply_pending_results()
+        self.close_phones_file(wait=True)
+        self.discard_results_file()
+        super().closeEvent(event)
     
     def on_startup_progress(self, message: str):
+        # Delivered through a queued signal, so the status bar repaints on the
+        # next pass of the event loop without re-entering it here
         self.add_log_message(f"⚙️ {message}")
         self.statusBar().showMessage(message)
-        # Force GUI update for startup messages
-        QApplication.processEvents()
     
     def flush_pending_updates(self):
         if hasattr(self, 'extraction_worker') and self.extraction_worker and not self.extraction_worker.is_stopped:
-            with self.extraction_worker.batch_lock:
-                if self.extraction_worker.result_batch:
-                    batch_copy = self.extraction_worker.result_batch.copy()
-                    self.extraction_worker.result_batch.clear()
-                    self.extraction_worker.last_update_time = time.time()
-                    
-                    if batch_copy:
-                        last_result, completed, total = batch_copy[-1]
-                        self.on_batch_progress_updated(batch_copy, completed, total)
+            self.apply_pending_results()
         
-        if self.is_large_dataset:
-            self.cleanup_memory()
+        self.flush_log()
     
-    def cleanup_memory(self):
-        if self.is_large_dataset:
-            if len(self.export_data) > config.MAX_LOG_ENTRIES:
-                self.export_data = self.export_data[-config.MAX_LOG_ENTRIES:]
-                self.add_log_message(f"🧹 Memory cleanup: Limited export data to {config.MAX_LOG_ENTRIES} entries")
-            
-            if len(self.log_entries) > config.MAX_LOG_ENTRIES:
-                self.log_entries = self.log_entries[-config.MAX_LOG_ENTRIES//2:]
-                self.add_log_message("🧹 Memory cleanup: Cleared old log entries")
+    def apply_pending_results(self):
+        batches = self.extraction_worker.take_pending_results()
+        if batches:
+            results = [result for batch, batch_completed, batch_total in batches for result in batch]
+            last_batch, completed, total = batches[-1]
+            self.apply_result_batch(results, completed, total)
 
 
 def main():
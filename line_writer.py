@@ -0,0 +1,133 @@
+"""
+Line Writer Module
+Appends lines of text (extracted phones, exportable results) to disk from a dedicated thread
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+
+import config
+
+# Queued by close() to tell the writer thread to flush and exit
+_STOP = object()
+
+
+class LineWriter:
+    """Collects lines from any thread and appends them in batches off the caller's thread"""
+    
+    def __init__(self, path: str, fsync: bool = False,
+                 batch_size: int = config.LINE_WRITER_BATCH_SIZE,
+                 flush_interval: float = config.LINE_WRITER_FLUSH_INTERVAL,
+                 on_closed: Optional[Callable[["LineWriter"], None]] = None):
+        self.path = path
+        # Only files meant to outlive the run are synced to disk on close
+        self.fsync = fsync
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.error: Optional[Exception] = None
+        # Called from the writer thread once the file is closed
+        self.on_closed = on_closed
+        
+        self.fd = None
+        # Keeps flush() from queueing its marker behind the stop
+        self.lock = threading.Lock()
+        self.closing = False
+        self.queue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._run, name="line-writer", daemon=True)
+        self.thread.start()
+    
+    def write(self, lines: List[str]):
+        if lines:
+            self.queue.put(lines)
+    
+    def close(self, wait: bool = True):
+        """Write everything still queued, then close the file (synced first if asked to)
+        
+        With wait=False the caller does not block on the final write and sync;
+        on_closed reports when they are done.
+        """
+        with self.lock:
+            self.closing = True
+            self.queue.put(_STOP)
+        if wait:
+            self.thread.join()
+    
+    def flush(self):
+        """Block until every line queued so far is on disk; not for the GUI thread"""
+        with self.lock:
+            done = None if self.closing else threading.Event()
+            if done:
+                self.queue.put(done)
+        
+        if done:
+            done.wait()
+        else:
+            self.thread.join()
+    
+    def _run(self):
+        pending = []
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            
+            if item is _STOP:
+                break
+            
+            if isinstance(item, threading.Event):
+                self._write(pending)
+                pending = []
+                deadline = None
+                item.set()
+                continue
+            
+            if item:
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.extend(item)
+            
+            # A batch goes out once it is full or its oldest line has waited long enough
+            if pending and (len(pending) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(pending)
+                pending = []
+                deadline = None
+        
+        self._write(pending)
+        self._close_file()
+        if self.on_closed:
+            self.on_closed(self)
+    
+    def _write(self, lines: List[str]):
+        if not lines:
+            return
+        
+        try:
+            if self.fd is None:
+                self.fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            # os.write may take only part of the payload; keep going until all
+            # of it is written
+            data = memoryview(("\n".join(lines) + "\n").encode("utf-8"))
+            while data:
+                data = data[os.write(self.fd, data):]
+        except Exception as e:
+            self.error = e
+    
+    def _close_file(self):
+        if self.fd is None:
+            return
+        
+        try:
+            if self.fsync:
+                os.fsync(self.fd)
+        except OSError:
+            pass
+        finally:
+            os.close(self.fd)
+            self.fd = None
